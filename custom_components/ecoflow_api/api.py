@@ -13,7 +13,13 @@ from typing import Any
 
 import aiohttp
 
-from .const import API_BASE_URL_EU, API_BASE_URL_US, API_TIMEOUT, REGION_EU
+from .const import (
+    API_BASE_URL_EU,
+    API_BASE_URL_US,
+    API_TIMEOUT,
+    REGION_EU,
+    DeltaPro3Cmd,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -374,11 +380,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_AC_CHARGE_SPEED
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_AC_CHARGE_SPEED,
+            DeltaPro3Cmd.SET_AC_CHARGE_SPEED,
             {
                 "chgPauseFlag": 1 if pause else 0,
                 "acChgPower": max(200, min(3000, power)),
@@ -401,8 +405,6 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_CHARGE_LEVEL
-
         params = {}
         if max_charge is not None:
             params["maxChgSoc"] = max(50, min(100, max_charge))
@@ -414,7 +416,7 @@ class EcoFlowApiClient:
 
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_CHARGE_LEVEL,
+            DeltaPro3Cmd.SET_CHARGE_LEVEL,
             params,
         )
 
@@ -428,11 +430,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_AC_OUT
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_AC_OUT,
+            DeltaPro3Cmd.SET_AC_OUT,
             {"acOutState": 1 if enabled else 0},
         )
 
@@ -446,11 +446,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_DC_OUT
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_DC_OUT,
+            DeltaPro3Cmd.SET_DC_OUT,
             {"dcOutState": 1 if enabled else 0},
         )
 
@@ -464,11 +462,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_12V_DC_OUT
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_12V_DC_OUT,
+            DeltaPro3Cmd.SET_12V_DC_OUT,
             {"dc12vOutState": 1 if enabled else 0},
         )
 
@@ -482,11 +478,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_BEEP
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_BEEP,
+            DeltaPro3Cmd.SET_BEEP,
             {"beepState": 1 if enabled else 0},
         )
 
@@ -500,11 +494,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_X_BOOST
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_X_BOOST,
+            DeltaPro3Cmd.SET_X_BOOST,
             {"xBoostState": 1 if enabled else 0},
         )
 
@@ -518,11 +510,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_AC_STANDBY_TIME
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_AC_STANDBY_TIME,
+            DeltaPro3Cmd.SET_AC_STANDBY_TIME,
             {"acStandbyTime": minutes},
         )
 
@@ -536,11 +526,9 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_DC_STANDBY_TIME
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_DC_STANDBY_TIME,
+            DeltaPro3Cmd.SET_DC_STANDBY_TIME,
             {"dcStandbyTime": minutes},
         )
 
@@ -556,10 +544,8 @@ class EcoFlowApiClient:
         Returns:
             API response
         """
-        from .const import CMD_DELTA_PRO_3_SET_LCD_STANDBY_TIME
-
         return await self.set_device_quota(
             device_sn,
-            CMD_DELTA_PRO_3_SET_LCD_STANDBY_TIME,
+            DeltaPro3Cmd.SET_LCD_STANDBY_TIME,
             {"lcdOffTime": seconds},
         )
@@ -20,6 +20,7 @@ from .const import (
     DEVICE_TYPE_DELTA_PRO_3,
     DEVICE_TYPE_RIVER_3,
     DOMAIN,
+    EXTRA_BATTERY_PREFIXES,
 )
 from .coordinator import EcoFlowDataCoordinator
 from .entity import EcoFlowBaseEntity
@@ -475,19 +476,6 @@ EXTRA_BATTERY_BINARY_SENSOR_DEFINITIONS = {
     },
 }
 
-# Possible prefixes for extra battery data in API response
-EXTRA_BATTERY_PREFIXES = [
-    "slave1",
-    "slave2",
-    "slave3",
-    "bms2",
-    "bms3",
-    "eb1",
-    "eb2",
-    "extraBms",
-    "slaveBattery",
-]
-
 
 def _detect_extra_batteries(data: dict[str, Any]) -> list[str]:
     """Detect extra battery prefixes in API response data.
@@ -503,10 +491,14 @@ def _detect_extra_batteries(data: dict[str, Any]) -> list[str]:
 
     found_prefixes: set[str] = set()
 
-    for key in data.keys():
-        for prefix in EXTRA_BATTERY_PREFIXES:
-            if key.startswith(prefix):
-                found_prefixes.add(prefix)
+    for key in data:
+        # A single tuple startswith() rejects the non-battery keys
+        if not key.startswith(EXTRA_BATTERY_PREFIXES):
+            continue
+        # No prefix starts another, so the first match is the only one
+        found_prefixes.add(
+            next(p for p in EXTRA_BATTERY_PREFIXES if key.startswith(p))
+        )
 
     return sorted(list(found_prefixes))
 
@@ -28,6 +28,8 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL,
     DEVICE_TYPE_DELTA_PRO_3,
+    DEVICE_TYPE_IDS,
+    DEVICE_TYPE_LABELS,
     DEVICE_TYPES,
     DOMAIN,
     OPTS_DIAGNOSTIC_MODE,
@@ -339,7 +341,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ): SelectSelector(
                     SelectSelectorConfig(
                         options=[
-                            {"value": k, "label": v} for k, v in DEVICE_TYPES.items()
+                            {"value": k, "label": v}
+                            for k, v in zip(DEVICE_TYPE_IDS, DEVICE_TYPE_LABELS)
                         ],
                         mode=SelectSelectorMode.DROPDOWN,
                     )
@@ -2,22 +2,130 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final, NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import (
+    REQUEST_REFRESH_DEFAULT_COOLDOWN,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 from .api import EcoFlowApiClient, EcoFlowApiError
-from .const import DOMAIN, OPTS_DIAGNOSTIC_MODE
+from .const import (
+    CONF_UPDATE_INTERVAL,
+    DEVICE_TYPES,
+    DOMAIN,
+    OPTS_DIAGNOSTIC_MODE,
+    UPDATE_INTERVAL_OPTIONS,
+    UPDATE_INTERVAL_TIMEDELTAS,
+    UPDATE_INTERVAL_VALUES,
+)
 from .data_holder import BoundFifoList
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _model_name(device_type: str) -> str:
+    """Return the model name for a device type, falling back to the type."""
+    return DEVICE_TYPES.get(device_type, device_type)
+
+
+class _Command(NamedTuple):
+    """Coordinator setter routed to an EcoFlowApiClient method."""
+
+    method: str  # API client method name
+    label: str  # Setting name for error logs
+    log_format: str  # Info log format, takes (value, device_sn)
+    param: str  # Parameter name recorded in diagnostics
+    client_kwarg: str | None = None  # Pass the value by this keyword
+
+
+# Setter commands by key; async_set_<key> forwards to _invoke("<key>", value)
+_COMMANDS: Final = MappingProxyType(
+    {
+        "ac_charging_power": _Command(
+            "set_ac_charging_power",
+            "AC charging power",
+            "Setting AC charging power to %dW for %s",
+            "power",
+        ),
+        "max_charge_level": _Command(
+            "set_charge_levels",
+            "max charge level",
+            "Setting max charge level to %d%% for %s",
+            "level",
+            "max_charge",
+        ),
+        "min_discharge_level": _Command(
+            "set_charge_levels",
+            "min discharge level",
+            "Setting min discharge level to %d%% for %s",
+            "level",
+            "min_discharge",
+        ),
+        "ac_output": _Command(
+            "set_ac_output",
+            "AC output",
+            "Setting AC output to %s for %s",
+            "enabled",
+        ),
+        "dc_output": _Command(
+            "set_dc_output",
+            "DC output",
+            "Setting DC output to %s for %s",
+            "enabled",
+        ),
+        "12v_dc_output": _Command(
+            "set_12v_dc_output",
+            "12V DC output",
+            "Setting 12V DC output to %s for %s",
+            "enabled",
+        ),
+        "beep": _Command(
+            "set_beep",
+            "beep",
+            "Setting beep to %s for %s",
+            "enabled",
+        ),
+        "x_boost": _Command(
+            "set_x_boost",
+            "X-Boost",
+            "Setting X-Boost to %s for %s",
+            "enabled",
+        ),
+        "ac_standby_time": _Command(
+            "set_ac_standby_time",
+            "AC standby time",
+            "Setting AC standby time to %d min for %s",
+            "minutes",
+        ),
+        "dc_standby_time": _Command(
+            "set_dc_standby_time",
+            "DC standby time",
+            "Setting DC standby time to %d min for %s",
+            "minutes",
+        ),
+        "lcd_standby_time": _Command(
+            "set_lcd_standby_time",
+            "LCD standby time",
+            "Setting LCD standby time to %d sec for %s",
+            "seconds",
+        ),
+    }
+)
+
+
 class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching EcoFlow data from API.
     
@@ -53,14 +161,36 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{device_sn}",
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=(
+                UPDATE_INTERVAL_TIMEDELTAS.get(update_interval)
+                or timedelta(seconds=update_interval)
+            ),
+            # The first setter call refreshes at once; the rest of a burst
+            # (scene, several switches) shares one trailing quota fetch
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_DEFAULT_COOLDOWN,
+                immediate=True,
+            ),
         )
         self.client = client
-        self.api_client = client  # Alias for compatibility
         self.device_sn = device_sn
         self.device_type = device_type
         self.update_interval_seconds = update_interval
+        # Shared by every entity of this device: unique_id = prefix + key
+        self.unique_id_prefix = f"{device_sn}_"
         self._last_data: dict[str, Any] = {}
+        # Device registry info only depends on the device, so build it once
+        self._model: str = _model_name(device_type)
+        self.device_identifiers: tuple[tuple[str, str], ...] = ((DOMAIN, device_sn),)
+        self._device_info = DeviceInfo(
+            identifiers=set(self.device_identifiers),
+            name=f"EcoFlow {self._model}",
+            manufacturer="EcoFlow",
+            model=self._model,
+            serial_number=device_sn,
+        )
         if config_entry:
             self.config_entry = config_entry
         
@@ -77,6 +207,22 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Track if we've logged connection success (to avoid spam)
         self._logged_rest_success = False
 
+    @staticmethod
+    def _intern_data_keys(data: dict[str, Any]) -> dict[str, Any]:
+        """Return data with interned keys.
+        
+        REST keys get the same treatment as MQTT payload keys, which are
+        interned on decode, so lookups against the identifier-like table
+        keys match on identity instead of comparing strings.
+        
+        Args:
+            data: Device data from the API
+            
+        Returns:
+            Device data with interned keys
+        """
+        return {sys.intern(key): value for key, value in data.items()}
+
     async def _async_wake_device(self) -> None:
         """Wake up device before requesting data.
         
@@ -119,7 +265,9 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._async_wake_device()
             
             # Fetch device data
-            data = await self.client.get_device_quota(self.device_sn)
+            data = self._intern_data_keys(
+                await self.client.get_device_quota(self.device_sn)
+            )
             
             # Log success only once (first successful request)
             if not self._logged_rest_success:
@@ -180,44 +328,57 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def api_client(self) -> EcoFlowApiClient:
+        """Return the API client (deprecated alias of client)."""
+        return self.client
+
+    @property
+    def model(self) -> str:
+        """Return the model name resolved from the device type."""
+        return self._model
+
+    @property
+    def device_info(self) -> DeviceInfo:
         """Return device info for device registry."""
-        from .const import DEVICE_TYPES
-        
-        return {
-            "identifiers": {(DOMAIN, self.device_sn)},
-            "name": f"EcoFlow {DEVICE_TYPES.get(self.device_type, self.device_type)}",
-            "manufacturer": "EcoFlow",
-            "model": DEVICE_TYPES.get(self.device_type, self.device_type),
-            "serial_number": self.device_sn,
-        }
+        return self._device_info
 
     # Command methods for Delta Pro 3
-    
-    async def async_set_ac_charging_power(self, power: int) -> None:
-        """Set AC charging power.
+
+    async def _invoke(self, cmd_key: str, value: Any) -> None:
+        """Run a setter from _COMMANDS and refresh data.
         
         Args:
-            power: Charging power in watts (200-3000)
+            cmd_key: Key into _COMMANDS
+            value: Value to set
+            
+        Raises:
+            EcoFlowApiError: If the API call fails
         """
+        command = _COMMANDS[cmd_key]
+        name = f"set_{cmd_key}"
         try:
-            _LOGGER.info("Setting AC charging power to %dW for %s", power, self.device_sn)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(command.log_format, value, self.device_sn)
             
             # Store command in diagnostic mode
             if self._diagnostic_mode:
                 self.set_commands.append({
                     "timestamp": time.time(),
-                    "command": "set_ac_charging_power",
-                    "params": {"power": power},
+                    "command": name,
+                    "params": {command.param: value},
                 })
             
-            await self.client.set_ac_charging_power(self.device_sn, power)
+            method = getattr(self.client, command.method)
+            if command.client_kwarg:
+                await method(self.device_sn, **{command.client_kwarg: value})
+            else:
+                await method(self.device_sn, value)
             
             # Store reply in diagnostic mode
             if self._diagnostic_mode:
                 self.set_replies.append({
                     "timestamp": time.time(),
-                    "command": "set_ac_charging_power",
+                    "command": name,
                     "success": True,
                 })
             
@@ -228,26 +389,28 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             if self._diagnostic_mode:
                 self.set_replies.append({
                     "timestamp": time.time(),
-                    "command": "set_ac_charging_power",
+                    "command": name,
                     "success": False,
                     "error": str(err),
                 })
-            _LOGGER.error("Failed to set AC charging power: %s", err)
+            _LOGGER.error("Failed to set %s: %s", command.label, err)
             raise
 
+    async def async_set_ac_charging_power(self, power: int) -> None:
+        """Set AC charging power.
+        
+        Args:
+            power: Charging power in watts (200-3000)
+        """
+        await self._invoke("ac_charging_power", power)
+
     async def async_set_max_charge_level(self, level: int) -> None:
         """Set maximum charge level.
         
         Args:
             level: Max charge level (50-100%)
         """
-        try:
-            _LOGGER.info("Setting max charge level to %d%% for %s", level, self.device_sn)
-            await self.client.set_charge_levels(self.device_sn, max_charge=level)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set max charge level: %s", err)
-            raise
+        await self._invoke("max_charge_level", level)
 
     async def async_set_min_discharge_level(self, level: int) -> None:
         """Set minimum discharge level.
@@ -255,13 +418,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             level: Min discharge level (0-30%)
         """
-        try:
-            _LOGGER.info("Setting min discharge level to %d%% for %s", level, self.device_sn)
-            await self.client.set_charge_levels(self.device_sn, min_discharge=level)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set min discharge level: %s", err)
-            raise
+        await self._invoke("min_discharge_level", level)
 
     async def async_set_ac_output(self, enabled: bool) -> None:
         """Set AC output state.
@@ -269,13 +426,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             enabled: Whether to enable AC output
         """
-        try:
-            _LOGGER.info("Setting AC output to %s for %s", enabled, self.device_sn)
-            await self.client.set_ac_output(self.device_sn, enabled)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set AC output: %s", err)
-            raise
+        await self._invoke("ac_output", enabled)
 
     async def async_set_dc_output(self, enabled: bool) -> None:
         """Set DC output state.
@@ -283,13 +434,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             enabled: Whether to enable DC output
         """
-        try:
-            _LOGGER.info("Setting DC output to %s for %s", enabled, self.device_sn)
-            await self.client.set_dc_output(self.device_sn, enabled)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set DC output: %s", err)
-            raise
+        await self._invoke("dc_output", enabled)
 
     async def async_set_12v_dc_output(self, enabled: bool) -> None:
         """Set 12V DC output state.
@@ -297,13 +442,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             enabled: Whether to enable 12V DC output
         """
-        try:
-            _LOGGER.info("Setting 12V DC output to %s for %s", enabled, self.device_sn)
-            await self.client.set_12v_dc_output(self.device_sn, enabled)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set 12V DC output: %s", err)
-            raise
+        await self._invoke("12v_dc_output", enabled)
 
     async def async_set_beep(self, enabled: bool) -> None:
         """Set beep state.
@@ -311,13 +450,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             enabled: Whether to enable beep
         """
-        try:
-            _LOGGER.info("Setting beep to %s for %s", enabled, self.device_sn)
-            await self.client.set_beep(self.device_sn, enabled)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set beep: %s", err)
-            raise
+        await self._invoke("beep", enabled)
 
     async def async_set_x_boost(self, enabled: bool) -> None:
         """Set X-Boost state.
@@ -325,13 +458,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             enabled: Whether to enable X-Boost
         """
-        try:
-            _LOGGER.info("Setting X-Boost to %s for %s", enabled, self.device_sn)
-            await self.client.set_x_boost(self.device_sn, enabled)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set X-Boost: %s", err)
-            raise
+        await self._invoke("x_boost", enabled)
 
     async def async_set_ac_standby_time(self, minutes: int) -> None:
         """Set AC standby time.
@@ -339,13 +466,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             minutes: Standby time in minutes (0 = never)
         """
-        try:
-            _LOGGER.info("Setting AC standby time to %d min for %s", minutes, self.device_sn)
-            await self.client.set_ac_standby_time(self.device_sn, minutes)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set AC standby time: %s", err)
-            raise
+        await self._invoke("ac_standby_time", minutes)
 
     async def async_set_dc_standby_time(self, minutes: int) -> None:
         """Set DC standby time.
@@ -353,13 +474,7 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             minutes: Standby time in minutes (0 = never)
         """
-        try:
-            _LOGGER.info("Setting DC standby time to %d min for %s", minutes, self.device_sn)
-            await self.client.set_dc_standby_time(self.device_sn, minutes)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set DC standby time: %s", err)
-            raise
+        await self._invoke("dc_standby_time", minutes)
 
     async def async_set_lcd_standby_time(self, seconds: int) -> None:
         """Set LCD/Screen standby time.
@@ -367,20 +482,30 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Args:
             seconds: Standby time in seconds (0 = never)
         """
-        try:
-            _LOGGER.info("Setting LCD standby time to %d sec for %s", seconds, self.device_sn)
-            await self.client.set_lcd_standby_time(self.device_sn, seconds)
-            await self.async_request_refresh()
-        except EcoFlowApiError as err:
-            _LOGGER.error("Failed to set LCD standby time: %s", err)
-            raise
+        await self._invoke("lcd_standby_time", seconds)
 
     async def async_set_update_interval(self, interval_seconds: int) -> None:
         """Set the update interval dynamically.
         
+        An interval that is not one of UPDATE_INTERVAL_OPTIONS is snapped to
+        the nearest allowed value.
+        
         Args:
             interval_seconds: New update interval in seconds
         """
+        if interval_seconds not in UPDATE_INTERVAL_OPTIONS:
+            nearest = min(
+                UPDATE_INTERVAL_VALUES,
+                key=lambda value: abs(value - interval_seconds),
+            )
+            _LOGGER.warning(
+                "Unsupported update interval %d seconds for %s, using %d",
+                interval_seconds,
+                self.device_sn,
+                nearest,
+            )
+            interval_seconds = nearest
+        
         _LOGGER.info(
             "Changing update interval from %d to %d seconds for %s",
             self.update_interval_seconds,
@@ -388,16 +513,16 @@ class EcoFlowDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             self.device_sn
         )
         self.update_interval_seconds = interval_seconds
-        self.update_interval = timedelta(seconds=interval_seconds)
+        self.update_interval = UPDATE_INTERVAL_TIMEDELTAS[interval_seconds]
         
         # Update config entry options to persist the change
         if self.config_entry:
-            from .const import CONF_UPDATE_INTERVAL
-            new_options = dict(self.config_entry.options)
-            new_options[CONF_UPDATE_INTERVAL] = interval_seconds
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
-                options=new_options
+                options={
+                    **self.config_entry.options,
+                    CONF_UPDATE_INTERVAL: interval_seconds,
+                },
             )
         
         # Force immediate refresh with new interval
@@ -1,16 +1,19 @@
 """Data holder for diagnostic mode - stores recent messages."""
 from __future__ import annotations
 
+from collections import deque
 from typing import Any, TypeVar
 
 _T = TypeVar("_T")
 
 
-class BoundFifoList(list[_T]):
+class BoundFifoList(deque[_T]):
     """Fixed-size FIFO list for storing recent messages.
     
     This is used in diagnostic mode to store recent REST requests,
     MQTT messages, and command responses for debugging purposes.
+    Newest items come first; the deque drops the oldest item once
+    maxlen is reached.
     
     Attributes:
         maxlen: Maximum number of items to store
@@ -22,16 +25,12 @@ class BoundFifoList(list[_T]):
         Args:
             maxlen: Maximum number of items to store (default: 20)
         """
-        super().__init__()
-        self.maxlen = maxlen
+        super().__init__(maxlen=maxlen)
     
     def append(self, item: _T) -> None:
-        """Append item to the list, removing oldest if at maxlen.
+        """Add item as the newest entry, removing the oldest if at maxlen.
         
         Args:
             item: Item to append
         """
-        super().insert(0, item)
-        while len(self) >= self.maxlen:
-            self.pop()
-
+        self.appendleft(item)
@@ -1,24 +1,45 @@
 """Device-specific modules for EcoFlow API integration.
 
 Each device type has its own subdirectory containing:
-- const.py: Device-specific constants
+- const.py: Device-specific constants and entity definition tables
 - Command mappings and API structures
 - Device metadata
 
 Supported devices:
+- Delta Pro (devices/delta_pro/)
 - Delta Pro 3 (devices/delta_pro_3/)
+
+Device modules are imported on first access, so loading one device's
+tables does not build the others.
 """
 from __future__ import annotations
 
-from . import delta_pro_3
+from importlib import import_module
+from types import ModuleType
 
-# Device type mapping
-DEVICE_MODULES = {
-    "DELTA Pro 3": delta_pro_3,
+# Device type (as reported by the API) -> device module name
+_DEVICE_MODULE_NAMES = {
+    "DELTA Pro": "delta_pro",
+    "DELTA Pro 3": "delta_pro_3",
 }
 
 __all__ = [
+    "delta_pro",
     "delta_pro_3",
     "DEVICE_MODULES",
 ]
 
+
+def __getattr__(name: str) -> ModuleType | dict[str, ModuleType]:
+    """Import device modules on first access (PEP 562)."""
+    if name in _DEVICE_MODULE_NAMES.values():
+        return import_module(f".{name}", __name__)
+    if name == "DEVICE_MODULES":
+        # Device type mapping, built once and then found as a global
+        modules = {
+            device_type: import_module(f".{module_name}", __name__)
+            for device_type, module_name in _DEVICE_MODULE_NAMES.items()
+        }
+        globals()["DEVICE_MODULES"] = modules
+        return modules
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
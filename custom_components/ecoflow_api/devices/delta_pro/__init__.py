@@ -0,0 +1,16 @@
+"""Delta Pro device-specific module.
+
+This module contains the device-specific constants and entity
+definition tables for the EcoFlow Delta Pro.
+"""
+from __future__ import annotations
+
+from .const import (
+    DEVICE_TYPE,
+    DEVICE_MODEL,
+)
+
+__all__ = [
+    "DEVICE_TYPE",
+    "DEVICE_MODEL",
+]
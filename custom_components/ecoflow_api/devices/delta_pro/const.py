@@ -0,0 +1,417 @@
+"""Constants for Delta Pro."""
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Final
+
+from ...const import (
+    ICON_FLASH,
+    ICON_THERMOMETER,
+    UNIT_A,
+    UNIT_MA,
+    UNIT_MIN,
+    UNIT_PCT,
+    UNIT_S,
+    UNIT_V,
+    UNIT_W,
+    NumberDesc,
+    SelectDesc,
+    SensorDesc,
+    SwitchDesc,
+    battery_pct,
+    current,
+    duration_min,
+    energy,
+    error,
+    frequency,
+    power,
+    temperature,
+    voltage,
+)
+
+# Device information
+DEVICE_TYPE: Final = "DELTA Pro"
+DEVICE_MODEL: Final = "Delta Pro"
+
+# ============================================================================
+# DELTA PRO (Original) - API Definitions
+# Based on EcoFlow Developer API documentation
+# ============================================================================
+
+# Delta Pro Sensors - based on GetAllQuotaResponse
+_DELTA_PRO_SENSORS: dict[str, SensorDesc] = {
+    # ============================================================================
+    # BMS Master - Battery Management System
+    # ============================================================================
+    "bmsMaster.soc": battery_pct("Battery Level", "mdi:battery"),
+    "bmsMaster.temp": temperature("Battery Temperature", ICON_THERMOMETER),
+    "bmsMaster.inputWatts": power("Battery Input Power", "mdi:battery-charging"),
+    "bmsMaster.outputWatts": power("Battery Output Power", "mdi:battery-arrow-down"),
+    "bmsMaster.vol": voltage("Battery Voltage", ICON_FLASH, UNIT_V),
+    "bmsMaster.amp": current("Battery Current", "mdi:current-dc", UNIT_A),
+    "bmsMaster.soh": SensorDesc("Battery Health", UNIT_PCT, None, "mdi:battery-heart"),
+    "bmsMaster.designCap": SensorDesc(
+        "Design Capacity", "mAh", None, "mdi:battery-high"
+    ),
+    "bmsMaster.remainCap": SensorDesc(
+        "Remaining Capacity", "mAh", None, "mdi:battery"
+    ),
+    "bmsMaster.fullCap": SensorDesc("Full Capacity", "mAh", None, "mdi:battery-high"),
+    "bmsMaster.maxCellVol": voltage("Max Cell Voltage", ICON_FLASH),
+    "bmsMaster.minCellVol": voltage("Min Cell Voltage", ICON_FLASH),
+    "bmsMaster.maxCellTemp": temperature(
+        "Max Cell Temperature", "mdi:thermometer-high"
+    ),
+    "bmsMaster.minCellTemp": temperature(
+        "Min Cell Temperature", "mdi:thermometer-low"
+    ),
+    "bmsMaster.maxMosTemp": temperature("Max MOS Temperature", "mdi:thermometer-high"),
+    "bmsMaster.minMosTemp": temperature("Min MOS Temperature", "mdi:thermometer-low"),
+    "bmsMaster.remainTime": duration_min("Battery Remaining Time"),
+    "bmsMaster.errCode": error("BMS Error Code"),
+    # ============================================================================
+    # Inverter
+    # ============================================================================
+    "inv.inputWatts": power("Inverter Input Power", "mdi:power-plug"),
+    "inv.outputWatts": power("Inverter Output Power", "mdi:power-socket"),
+    "inv.invOutVol": voltage("AC Output Voltage", ICON_FLASH),
+    "inv.invOutAmp": current("AC Output Current", "mdi:current-ac"),
+    "inv.invOutFreq": frequency("AC Output Frequency", "mdi:sine-wave"),
+    "inv.acInVol": voltage("AC Input Voltage", ICON_FLASH),
+    "inv.acInAmp": current("AC Input Current", "mdi:current-ac"),
+    "inv.acInFreq": frequency("AC Input Frequency", "mdi:sine-wave"),
+    "inv.outTemp": temperature("Inverter Temperature", ICON_THERMOMETER),
+    "inv.dcInVol": voltage("DC Input Voltage", ICON_FLASH),
+    "inv.dcInAmp": current("DC Input Current", "mdi:current-dc"),
+    "inv.dcInTemp": temperature("DC Input Temperature", ICON_THERMOMETER),
+    "inv.cfgAcOutFreq": SensorDesc(
+        "Configured AC Output Frequency", None, None, "mdi:sine-wave"
+    ),
+    "inv.cfgSlowChgWatts": power("AC Slow Charging Power", "mdi:lightning-bolt"),
+    "inv.cfgFastChgWatts": power("AC Fast Charging Power", "mdi:lightning-bolt"),
+    "inv.cfgStandbyMin": duration_min("AC Standby Time"),
+    "inv.errCode": error("Inverter Error Code"),
+    # ============================================================================
+    # MPPT - Solar Charger
+    # ============================================================================
+    "mppt.inVol": voltage("Solar Input Voltage", "mdi:solar-power"),
+    "mppt.inAmp": current("Solar Input Current", "mdi:solar-power"),
+    "mppt.inWatts": power("Solar Input Power", "mdi:solar-power"),
+    "mppt.outVol": voltage("MPPT Output Voltage", ICON_FLASH),
+    "mppt.outAmp": current("MPPT Output Current", "mdi:current-dc"),
+    "mppt.outWatts": power("MPPT Output Power", ICON_FLASH),
+    "mppt.mpptTemp": temperature("MPPT Temperature", ICON_THERMOMETER),
+    "mppt.dcdc12vVol": voltage("DC 12V Output Voltage", "mdi:car-battery"),
+    "mppt.dcdc12vAmp": current("DC 12V Output Current", "mdi:car-battery"),
+    "mppt.dcdc12vWatts": power("DC 12V Output Power", "mdi:car-battery"),
+    "mppt.carOutVol": voltage("Car Charger Output Voltage", "mdi:car"),
+    "mppt.carOutAmp": current("Car Charger Output Current", "mdi:car"),
+    "mppt.carOutWatts": power("Car Charger Output Power", "mdi:car"),
+    "mppt.carTemp": temperature("Car Charger Temperature", ICON_THERMOMETER),
+    "mppt.cfgDcChgCurrent": current(
+        "Car Charging Current Setting", "mdi:car-battery"
+    ),
+    "mppt.faultCode": error("MPPT Fault Code"),
+    # ============================================================================
+    # PD - Power Distribution
+    # ============================================================================
+    "pd.soc": battery_pct("Display SOC", "mdi:battery"),
+    "pd.wattsOutSum": power("Total Output Power", "mdi:transmission-tower-export"),
+    "pd.wattsInSum": power("Total Input Power", "mdi:transmission-tower-import"),
+    "pd.remainTime": duration_min("Remaining Time"),
+    "pd.usb1Watts": power("USB 1 Output Power", "mdi:usb-port"),
+    "pd.usb2Watts": power("USB 2 Output Power", "mdi:usb-port"),
+    "pd.qcUsb1Watts": power("QC USB 1 Output Power", "mdi:usb-port"),
+    "pd.qcUsb2Watts": power("QC USB 2 Output Power", "mdi:usb-port"),
+    "pd.typec1Watts": power("Type-C 1 Output Power", "mdi:usb-c-port"),
+    "pd.typec2Watts": power("Type-C 2 Output Power", "mdi:usb-c-port"),
+    "pd.typec1Temp": temperature("Type-C 1 Temperature", ICON_THERMOMETER),
+    "pd.typec2Temp": temperature("Type-C 2 Temperature", ICON_THERMOMETER),
+    "pd.carWatts": power("Car Output Power", "mdi:car"),
+    "pd.carTemp": temperature("Car Output Temperature", ICON_THERMOMETER),
+    "pd.standByMode": duration_min("Device Standby Time", "mdi:timer-sleep"),
+    "pd.lcdOffSec": SensorDesc(
+        "Screen Off Time", UNIT_S, "duration", "mdi:monitor-off"
+    ),
+    "pd.lcdBrightness": SensorDesc(
+        "Screen Brightness", UNIT_PCT, None, "mdi:brightness-6"
+    ),
+    "pd.chgPowerDc": energy("Cumulative DC Charged", "mdi:battery-charging"),
+    "pd.chgSunPower": energy("Cumulative Solar Charged", "mdi:solar-power"),
+    "pd.chgPowerAc": energy("Cumulative AC Charged", "mdi:power-plug"),
+    "pd.dsgPowerDc": energy("Cumulative DC Discharged", "mdi:battery-arrow-down"),
+    "pd.dsgPowerAc": energy("Cumulative AC Discharged", "mdi:power-socket"),
+    "pd.errCode": error("PD Error Code"),
+    "pd.wifiRssi": SensorDesc(
+        "WiFi Signal Strength", "dBm", "signal_strength", "mdi:wifi"
+    ),
+    # ============================================================================
+    # EMS - Energy Management System
+    # ============================================================================
+    "ems.maxChargeSoc": SensorDesc(
+        "Max Charge Level", UNIT_PCT, None, "mdi:battery-charging-100"
+    ),
+    "ems.minDsgSoc": SensorDesc(
+        "Min Discharge Level", UNIT_PCT, None, "mdi:battery-10"
+    ),
+    "ems.minOpenOilEbSoc": SensorDesc(
+        "Generator Auto Start SOC", UNIT_PCT, None, "mdi:engine"
+    ),
+    "ems.maxCloseOilEbSoc": SensorDesc(
+        "Generator Auto Stop SOC", UNIT_PCT, None, "mdi:engine-off"
+    ),
+    "ems.chgRemainTime": duration_min("Charge Remaining Time", "mdi:battery-charging"),
+    "ems.dsgRemainTime": duration_min(
+        "Discharge Remaining Time", "mdi:battery-arrow-down"
+    ),
+    "ems.lcdShowSoc": battery_pct("LCD Display SOC", "mdi:battery"),
+    "ems.f32LcdShowSoc": battery_pct("LCD Display SOC (Float)", "mdi:battery"),
+}
+
+# Delta Pro Binary Sensors
+_DELTA_PRO_BINARY_SENSORS: dict[str, dict[str, Any]] = {
+    "inv.cfgAcEnabled": {
+        "name": "AC Output Enabled",
+        "device_class": "power",
+        "icon": "mdi:power-socket",
+    },
+    "inv.cfgAcXboost": {
+        "name": "X-Boost Enabled",
+        "device_class": None,
+        "icon": "mdi:lightning-bolt",
+    },
+    "mppt.carState": {
+        "name": "Car Charger Enabled",
+        "device_class": None,
+        "icon": "mdi:car",
+    },
+    "pd.beepState": {
+        "name": "Beep Enabled",
+        "device_class": None,
+        "icon": "mdi:volume-high",
+    },
+    "pd.dcOutState": {
+        "name": "DC Output Enabled",
+        "device_class": "power",
+        "icon": "mdi:current-dc",
+    },
+    "pd.carState": {
+        "name": "Car Output Enabled",
+        "device_class": None,
+        "icon": "mdi:car",
+    },
+    "inv.acPassbyAutoEn": {
+        "name": "Bypass AC Auto Start",
+        "device_class": None,
+        "icon": "mdi:power-plug",
+    },
+}
+
+# Delta Pro Switches - controllable settings
+_DELTA_PRO_SWITCHES: dict[str, SwitchDesc] = {
+    "ac_output": SwitchDesc(
+        "AC Output",
+        state_key="inv.cfgAcEnabled",
+        cmd_set=32,
+        cmd_id=66,
+        param_key="enabled",
+        icon_on="mdi:power-socket",
+        icon_off="mdi:power-socket-off",
+    ),
+    "x_boost": SwitchDesc(
+        "X-Boost",
+        state_key="inv.cfgAcXboost",
+        cmd_set=32,
+        cmd_id=66,
+        param_key="xboost",
+        icon_on="mdi:lightning-bolt",
+        icon_off="mdi:lightning-bolt-outline",
+    ),
+    "car_charger": SwitchDesc(
+        "Car Charger",
+        state_key="mppt.carState",
+        cmd_set=32,
+        cmd_id=81,
+        param_key="enabled",
+        icon_on="mdi:car",
+        icon_off="mdi:car-off",
+    ),
+    "beeper": SwitchDesc(
+        "Beeper",
+        state_key="pd.beepState",
+        cmd_set=32,
+        cmd_id=38,
+        param_key="enabled",
+        icon_on="mdi:volume-high",
+        icon_off="mdi:volume-off",
+    ),
+    "bypass_ac_auto_start": SwitchDesc(
+        "Bypass AC Auto Start",
+        state_key="inv.acPassbyAutoEn",
+        cmd_set=32,
+        cmd_id=84,
+        param_key="enabled",
+        icon_on="mdi:power-plug",
+        icon_off="mdi:power-plug-off",
+    ),
+}
+
+# Delta Pro Numbers - adjustable values
+_DELTA_PRO_NUMBERS: dict[str, NumberDesc] = {
+    "max_charge_level": NumberDesc(
+        "Max Charge Level",
+        state_key="ems.maxChargeSoc",
+        cmd_set=32,
+        cmd_id=49,
+        param_key="maxChgSoc",
+        min=50,
+        max=100,
+        step=1,
+        unit=UNIT_PCT,
+        icon="mdi:battery-charging-100",
+    ),
+    "min_discharge_level": NumberDesc(
+        "Min Discharge Level",
+        state_key="ems.minDsgSoc",
+        cmd_set=32,
+        cmd_id=51,
+        param_key="minDsgSoc",
+        min=0,
+        max=30,
+        step=1,
+        unit=UNIT_PCT,
+        icon="mdi:battery-10",
+    ),
+    "car_input_current": NumberDesc(
+        "Car Input Current",
+        state_key="mppt.cfgDcChgCurrent",
+        cmd_set=32,
+        cmd_id=71,
+        param_key="currMa",
+        min=4000,
+        max=8000,
+        step=1000,
+        unit=UNIT_MA,
+        icon="mdi:car-battery",
+    ),
+    "screen_brightness": NumberDesc(
+        "Screen Brightness",
+        state_key="pd.lcdBrightness",
+        cmd_set=32,
+        cmd_id=39,
+        param_key="lcdBrightness",
+        min=0,
+        max=100,
+        step=10,
+        unit=UNIT_PCT,
+        icon="mdi:brightness-6",
+    ),
+    "device_standby_time": NumberDesc(
+        "Device Standby Time",
+        state_key="pd.standByMode",
+        cmd_set=32,
+        cmd_id=33,
+        param_key="standByMode",
+        min=0,
+        max=5999,
+        step=30,
+        unit=UNIT_MIN,
+        icon="mdi:timer-sleep",
+    ),
+    "screen_timeout": NumberDesc(
+        "Screen Timeout",
+        state_key="pd.lcdOffSec",
+        cmd_set=32,
+        cmd_id=39,
+        param_key="lcdTime",
+        min=0,
+        max=1800,
+        step=30,
+        unit=UNIT_S,
+        icon="mdi:monitor-off",
+    ),
+    "ac_standby_time": NumberDesc(
+        "AC Standby Time",
+        state_key="inv.cfgStandbyMin",
+        cmd_set=32,
+        cmd_id=153,
+        param_key="standByMins",
+        min=0,
+        max=720,
+        step=30,
+        unit=UNIT_MIN,
+        icon="mdi:timer",
+    ),
+    "ac_charging_power": NumberDesc(
+        "AC Charging Power",
+        state_key="inv.cfgSlowChgWatts",
+        cmd_set=32,
+        cmd_id=69,
+        param_key="slowChgPower",
+        min=200,
+        max=2900,
+        step=100,
+        unit=UNIT_W,
+        icon="mdi:lightning-bolt",
+    ),
+    "generator_auto_start_soc": NumberDesc(
+        "Generator Auto Start SOC",
+        state_key="ems.minOpenOilEbSoc",
+        cmd_set=32,
+        cmd_id=52,
+        param_key="openOilSoc",
+        min=0,
+        max=100,
+        step=5,
+        unit=UNIT_PCT,
+        icon="mdi:engine",
+    ),
+    "generator_auto_stop_soc": NumberDesc(
+        "Generator Auto Stop SOC",
+        state_key="ems.maxCloseOilEbSoc",
+        cmd_set=32,
+        cmd_id=53,
+        param_key="closeOilSoc",
+        min=0,
+        max=100,
+        step=5,
+        unit=UNIT_PCT,
+        icon="mdi:engine-off",
+    ),
+}
+
+# Delta Pro Selects - dropdown options
+_DELTA_PRO_SELECTS: dict[str, SelectDesc] = {
+    "pv_charging_type": SelectDesc(
+        "PV Charging Type",
+        state_key="mppt.cfgChgType",
+        cmd_set=32,
+        cmd_id=82,
+        param_key="chgType",
+        icon="mdi:solar-power",
+        options={
+            "Auto": 0,
+            "MPPT": 1,
+            "Adapter": 2,
+        },
+    ),
+    "ac_output_frequency": SelectDesc(
+        "AC Output Frequency",
+        state_key="inv.cfgAcOutFreq",
+        cmd_set=32,
+        cmd_id=66,
+        param_key="cfgAcOutFreq",
+        icon="mdi:sine-wave",
+        options={
+            "50 Hz": 1,
+            "60 Hz": 2,
+        },
+    ),
+}
+
+# Read-only views of the Delta Pro tables
+DELTA_PRO_SENSORS: Final = MappingProxyType(_DELTA_PRO_SENSORS)
+DELTA_PRO_BINARY_SENSORS: Final = MappingProxyType(_DELTA_PRO_BINARY_SENSORS)
+DELTA_PRO_SWITCHES: Final = MappingProxyType(_DELTA_PRO_SWITCHES)
+DELTA_PRO_NUMBERS: Final = MappingProxyType(_DELTA_PRO_NUMBERS)
+DELTA_PRO_SELECTS: Final = MappingProxyType(_DELTA_PRO_SELECTS)
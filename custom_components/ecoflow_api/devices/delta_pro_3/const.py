@@ -1,7 +1,29 @@
 """Constants for Delta Pro 3."""
 from __future__ import annotations
 
-from typing import Final
+from types import MappingProxyType
+from typing import Any, Final
+
+from ...const import (
+    UNIT_A,
+    UNIT_H,
+    UNIT_MIN,
+    UNIT_PCT,
+    UNIT_S,
+    UNIT_V,
+    UNIT_W,
+    DeltaPro3Cmd,
+    SensorDesc,
+    battery_pct,
+    current,
+    duration_min,
+    energy,
+    error,
+    frequency,
+    power,
+    temperature,
+    voltage,
+)
 
 # Device information
 DEVICE_TYPE: Final = "DELTA Pro 3"
@@ -17,4 +39,471 @@ COMMAND_BASE: Final = {
     "needAck": True,
 }
 
+# Sensor keys mapping for Delta Pro 3
+# Based on real API response from Delta Pro 3 device
+_DELTA_PRO_3_SENSORS: dict[str, SensorDesc] = {
+    # Battery Status (BMS)
+    "bmsBattSoc": battery_pct("Battery Level (BMS)", "mdi:battery"),
+    "bmsBattSoh": battery_pct("State of Health (BMS)", "mdi:battery-heart"),
+    "bmsChgRemTime": duration_min(
+        "Charge Remaining Time (BMS)", "mdi:battery-charging"
+    ),
+    "bmsDsgRemTime": duration_min(
+        "Discharge Remaining Time (BMS)", "mdi:battery-arrow-down"
+    ),
+    "bmsDesignCap": SensorDesc("Design Capacity", "mAh", None, "mdi:battery-high"),
+    # Battery Status (CMS)
+    "cmsBattSoc": battery_pct("Battery Level (CMS)", "mdi:battery"),
+    "cmsBattSoh": battery_pct("State of Health (CMS)", "mdi:battery-heart"),
+    # Note: Cycles are not available via REST API for Delta Pro 3
+    # They are only available via MQTT (WebSocket) connection
+    # We can estimate cycles based on SOH: estimated_cycles ≈ (100 - SOH) × 10
+    # For a new battery (SOH=100%), estimated cycles ≈ 0
+    # For a degraded battery (SOH=80%), estimated cycles ≈ 200
+    "cmsChgRemTime": duration_min(
+        "Charge Remaining Time (CMS)", "mdi:battery-charging"
+    ),
+    "cmsDsgRemTime": duration_min(
+        "Discharge Remaining Time (CMS)", "mdi:battery-arrow-down"
+    ),
+    "cmsBattFullEnergy": energy("Full Energy Capacity", "mdi:battery-high"),
+    "cmsMaxChgSoc": battery_pct("Max Charge Level", "mdi:battery-charging-100"),
+    "cmsMinDsgSoc": battery_pct("Min Discharge Level", "mdi:battery-low"),
+    # Power Flow
+    "powInSumW": power("Total Input Power", "mdi:transmission-tower-import"),
+    "powOutSumW": power("Total Output Power", "mdi:transmission-tower-export"),
+    "powGetAcIn": power("AC Input Power", "mdi:power-plug"),
+    "powGetAc": power("AC Output Power", "mdi:power-socket"),
+    "powGetAcHvOut": power("AC HV Output Power", "mdi:power-socket"),
+    "powGetAcLvOut": power("AC LV Output Power", "mdi:power-socket"),
+    "powGetPvH": power("Solar Input Power (High)", "mdi:solar-power"),
+    "powGetPvL": power("Solar Input Power (Low)", "mdi:solar-power"),
+    "powGet12v": power("12V DC Output Power", "mdi:current-dc"),
+    "powGet24v": power("24V DC Output Power", "mdi:current-dc"),
+    "powGetTypec1": power("USB-C1 Output Power", "mdi:usb-port"),
+    "powGetTypec2": power("USB-C2 Output Power", "mdi:usb-port"),
+    "powGetQcusb1": power("QC USB1 Output Power", "mdi:usb-port"),
+    "powGetQcusb2": power("QC USB2 Output Power", "mdi:usb-port"),
+    # Temperature Sensors
+    "bmsMaxCellTemp": temperature("Max Cell Temperature", "mdi:thermometer-high"),
+    "bmsMinCellTemp": temperature("Min Cell Temperature", "mdi:thermometer-low"),
+    "bmsMaxMosTemp": temperature("Max MOSFET Temperature", "mdi:thermometer-high"),
+    "bmsMinMosTemp": temperature("Min MOSFET Temperature", "mdi:thermometer-low"),
+    # Settings
+    "acStandbyTime": duration_min("AC Standby Time", "mdi:timer-outline"),
+    "dcStandbyTime": duration_min("DC Standby Time", "mdi:timer-outline"),
+    "screenOffTime": SensorDesc(
+        "Screen Off Time", UNIT_S, "duration", "mdi:monitor-off"
+    ),
+    "lcdLight": SensorDesc("LCD Brightness", UNIT_PCT, None, "mdi:brightness-6"),
+    # AC Output
+    "acOutFreq": frequency("AC Output Frequency", "mdi:sine-wave"),
+    # Device Status
+    "errcode": error("Device Error Code"),
+    "devSleepState": SensorDesc("Device Sleep State", None, None, "mdi:sleep"),
+    "devStandbyTime": duration_min("Device Standby Time", "mdi:timer-sleep"),
+    "bleStandbyTime": SensorDesc(
+        "Bluetooth Standby Time", UNIT_H, "duration", "mdi:bluetooth"
+    ),
+    # Battery Status (BMS) - Additional
+    "bmsChgDsgState": SensorDesc(
+        "BMS Charge/Discharge State",
+        None,
+        "enum",
+        "mdi:battery-sync",
+        ["idle", "discharging", "charging"],
+    ),
+    # Battery Status (CMS) - Additional
+    "cmsChgDsgState": SensorDesc(
+        "CMS Charge/Discharge State",
+        None,
+        "enum",
+        "mdi:battery-sync",
+        ["idle", "discharging", "charging"],
+    ),
+    "cmsBmsRunState": SensorDesc("CMS BMS Run State", None, None, "mdi:power"),
+    "cmsOilSelfStart": SensorDesc(
+        "Smart Generator Auto Start", None, None, "mdi:engine"
+    ),
+    "cmsOilOffSoc": battery_pct("Generator Auto Stop SOC", "mdi:engine-off"),
+    "cmsOilOnSoc": battery_pct("Generator Auto Start SOC", "mdi:engine"),
+    # Power Flow - Additional
+    "powGet5p8": power("Power In/Out Port Power", "mdi:power-plug"),
+    "powGet4p81": power("Extra Battery Port 1 Power", "mdi:battery-plus"),
+    "powGet4p82": power("Extra Battery Port 2 Power", "mdi:battery-plus"),
+    "powGetAcLvTt30Out": power("AC LV TT30 Output Power", "mdi:power-socket"),
+    # Plug-in Info - Power Limits
+    "plugInInfoAcInChgHalPowMax": power(
+        "AC Input Half Charging Power Max", "mdi:lightning-bolt"
+    ),
+    "plugInInfoPvLChgAmpMax": current(
+        "PV Low Voltage Charging Current Max", "mdi:current-ac", UNIT_A
+    ),
+    "plugInInfoAcInFeq": frequency("AC Input Frequency", "mdi:sine-wave"),
+    "plugInInfoPvLType": SensorDesc(
+        "PV Low Voltage Type", None, None, "mdi:solar-power"
+    ),
+    "plugInInfo5p8RunState": SensorDesc(
+        "Power In/Out Port Run State", None, None, "mdi:power-plug"
+    ),
+    "plugInInfo4p82RunState": SensorDesc(
+        "Extra Battery Port 2 Run State", None, None, "mdi:battery-plus"
+    ),
+    "plugInInfo5p8ChgHalPowMax": power(
+        "Power In/Out Port Half Charging Power Max", "mdi:lightning-bolt"
+    ),
+    "plugInInfoPvHChgAmpMax": current(
+        "PV High Voltage Charging Current Max", "mdi:current-ac", UNIT_A
+    ),
+    "plugInInfo5p8DsgPowMax": power(
+        "Power In/Out Port Discharge Power Max", "mdi:power-plug"
+    ),
+    "plugInInfoAcInChgPowMax": power(
+        "AC Input Charging Power Max", "mdi:lightning-bolt"
+    ),
+    "plugInInfoPvHType": SensorDesc(
+        "PV High Voltage Type", None, None, "mdi:solar-power"
+    ),
+    "plugInInfoAcOutDsgPowMax": power(
+        "AC Output Discharge Power Max", "mdi:power-socket"
+    ),
+    "plugInInfo5p8ChgPowMax": power(
+        "Power In/Out Port Charging Power Max", "mdi:lightning-bolt"
+    ),
+    "plugInInfoPvHDcAmpMax": current(
+        "PV High Voltage DC Current Max", "mdi:current-ac", UNIT_A
+    ),
+    "plugInInfoPvLChgVolMax": voltage(
+        "PV Low Voltage Charging Voltage Max", "mdi:lightning-bolt", UNIT_V
+    ),
+    "plugInInfoPvLDcAmpMax": current(
+        "PV Low Voltage DC Current Max", "mdi:current-ac", UNIT_A
+    ),
+    "plugInInfoPvHChgVolMax": voltage(
+        "PV High Voltage Charging Voltage Max", "mdi:lightning-bolt", UNIT_V
+    ),
+    "plugInInfo4p81Sn": SensorDesc(
+        "Extra Battery Port 1 Serial Number", None, None, "mdi:barcode"
+    ),
+    "plugInInfo5p8Sn": SensorDesc(
+        "Power In/Out Port Serial Number", None, None, "mdi:barcode"
+    ),
+    "plugInInfo4p82Sn": SensorDesc(
+        "Extra Battery Port 2 Serial Number", None, None, "mdi:barcode"
+    ),
+    "plugInInfo4p81RunState": SensorDesc(
+        "Extra Battery Port 1 Run State", None, None, "mdi:battery-plus"
+    ),
+    "plugInInfo4p81DsgChgType": SensorDesc(
+        "Extra Battery Port 1 Charge/Discharge Type", None, None, "mdi:battery-sync"
+    ),
+    "plugInInfo4p82DsgChgType": SensorDesc(
+        "Extra Battery Port 2 Charge/Discharge Type", None, None, "mdi:battery-sync"
+    ),
+    "plugInInfo5p8DsgChg": SensorDesc(
+        "Power In/Out Port Charge/Discharge", None, None, "mdi:battery-sync"
+    ),
+    # Flow Info - Additional (these are already in binary sensors, but adding as sensors too)
+    "flowInfoPvL": SensorDesc(
+        "PV Low Voltage Flow Status",
+        None,
+        "enum",
+        "mdi:solar-power",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfoPvH": SensorDesc(
+        "PV High Voltage Flow Status",
+        None,
+        "enum",
+        "mdi:solar-power",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfoTypec1": SensorDesc(
+        "Type-C 1 Flow Status", None, "enum", "mdi:usb-c-port", ["off", "unknown", "on"]
+    ),
+    "flowInfoTypec2": SensorDesc(
+        "Type-C 2 Flow Status", None, "enum", "mdi:usb-c-port", ["off", "unknown", "on"]
+    ),
+    "flowInfoAcLvOut": SensorDesc(
+        "AC LV Output Flow Status",
+        None,
+        "enum",
+        "mdi:power-socket",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo4p82Out": SensorDesc(
+        "Extra Battery Port 2 Output Flow Status",
+        None,
+        "enum",
+        "mdi:battery-plus",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfoAcIn": SensorDesc(
+        "AC Input Flow Status", None, "enum", "mdi:power-plug", ["off", "unknown", "on"]
+    ),
+    "flowInfoAcHvOut": SensorDesc(
+        "AC HV Output Flow Status",
+        None,
+        "enum",
+        "mdi:power-socket",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo12v": SensorDesc(
+        "12V Output Flow Status",
+        None,
+        "enum",
+        "mdi:current-dc",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo24v": SensorDesc(
+        "24V Output Flow Status",
+        None,
+        "enum",
+        "mdi:current-dc",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo4p81In": SensorDesc(
+        "Extra Battery Port 1 Input Flow Status",
+        None,
+        "enum",
+        "mdi:battery-plus",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfoQcusb1": SensorDesc(
+        "QC USB 1 Flow Status", None, "enum", "mdi:usb-port", ["off", "unknown", "on"]
+    ),
+    "flowInfoQcusb2": SensorDesc(
+        "QC USB 2 Flow Status", None, "enum", "mdi:usb-port", ["off", "unknown", "on"]
+    ),
+    "flowInfo4p82In": SensorDesc(
+        "Extra Battery Port 2 Input Flow Status",
+        None,
+        "enum",
+        "mdi:battery-plus",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo5p8In": SensorDesc(
+        "Power In/Out Port Input Flow Status",
+        None,
+        "enum",
+        "mdi:power-plug",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo4p81Out": SensorDesc(
+        "Extra Battery Port 1 Output Flow Status",
+        None,
+        "enum",
+        "mdi:battery-plus",
+        ["off", "unknown", "on"],
+    ),
+    "flowInfo5p8Out": SensorDesc(
+        "Power In/Out Port Output Flow Status",
+        None,
+        "enum",
+        "mdi:power-plug",
+        ["off", "unknown", "on"],
+    ),
+    # Additional Settings
+    "fastChargeSwitch": SensorDesc(
+        "Fast Charge Switch", None, None, "mdi:lightning-bolt"
+    ),
+    "energyBackupEn": SensorDesc(
+        "Energy Backup Enabled", None, None, "mdi:backup-restore"
+    ),
+    "llcHvLvFlag": SensorDesc("HV/LV AC Flag", None, None, "mdi:power-plug"),
+    "acLvAlwaysOn": SensorDesc("AC LV Always On", None, None, "mdi:power-socket"),
+    "energyBackupStartSoc": battery_pct(
+        "Energy Backup Start SOC", "mdi:backup-restore"
+    ),
+    "acHvAlwaysOn": SensorDesc("AC HV Always On", None, None, "mdi:power-socket"),
+    "acAlwaysOnMiniSoc": battery_pct("AC Always On Minimum SOC", "mdi:power-socket"),
+    "generatorPvHybridModeOpen": SensorDesc(
+        "Generator PV Hybrid Mode", None, None, "mdi:engine"
+    ),
+    "generatorCareModeOpen": SensorDesc(
+        "Generator Care Mode", None, None, "mdi:engine"
+    ),
+    "generatorPvHybridModeSocMax": battery_pct(
+        "Generator PV Hybrid Mode Max SOC", "mdi:engine"
+    ),
+    # MQTT-only sensors (available only when MQTT is enabled)
+    "bmsCycles": SensorDesc(
+        "Battery Cycles",
+        "cycles",
+        None,
+        "mdi:sync",
+        key="cycles",  # MQTT field name
+        mqtt_only=True,  # Only available via MQTT
+    ),
+}
+
+# Binary Sensors for Delta Pro 3 (status indicators)
+_DELTA_PRO_3_BINARY_SENSORS: dict[str, dict[str, Any]] = {
+    "plugInInfoAcChargerFlag": {
+        "name": "AC Charging",
+        "device_class": "battery_charging",
+        "icon": "mdi:power-plug",
+    },
+    "plugInInfoPvHChargerFlag": {
+        "name": "Solar Charging (High)",
+        "device_class": "battery_charging",
+        "icon": "mdi:solar-power",
+    },
+    "plugInInfoPvLChargerFlag": {
+        "name": "Solar Charging (Low)",
+        "device_class": "battery_charging",
+        "icon": "mdi:solar-power",
+    },
+    "plugInInfo4p81ChargerFlag": {
+        "name": "4P81 Charging",
+        "device_class": "battery_charging",
+        "icon": "mdi:battery-charging",
+    },
+    "plugInInfo4p82ChargerFlag": {
+        "name": "4P82 Charging",
+        "device_class": "battery_charging",
+        "icon": "mdi:battery-charging",
+    },
+    "plugInInfo5p8ChargerFlag": {
+        "name": "5P8 Charging",
+        "device_class": "battery_charging",
+        "icon": "mdi:battery-charging",
+    },
+    "xboostEn": {
+        "name": "X-Boost Enabled",
+        "device_class": "power",
+        "icon": "mdi:lightning-bolt",
+    },
+    "enBeep": {
+        "name": "Beep Enabled",
+        "device_class": None,
+        "icon": "mdi:volume-high",
+    },
+    "acEnergySavingOpen": {
+        "name": "AC Energy Saving",
+        "device_class": None,
+        "icon": "mdi:leaf",
+    },
+    "energyBackupEn": {
+        "name": "Energy Backup Enabled",
+        "device_class": None,
+        "icon": "mdi:backup-restore",
+    },
+    "stormPatternEnable": {
+        "name": "Storm Pattern Enabled",
+        "device_class": None,
+        "icon": "mdi:weather-lightning",
+    },
+    "generatorCareModeOpen": {
+        "name": "Generator Care Mode",
+        "device_class": None,
+        "icon": "mdi:engine",
+    },
+    "llcGFCIFlag": {
+        "name": "GFCI Triggered",
+        "device_class": "problem",
+        "icon": "mdi:alert-circle",
+    },
+}
+
+# Switches for Delta Pro 3 (controllable settings)
+_DELTA_PRO_3_SWITCHES: dict[str, dict[str, Any]] = {
+    "xboostEn": {
+        "name": "X-Boost",
+        "icon": "mdi:lightning-bolt",
+        "command": DeltaPro3Cmd.SET_X_BOOST,
+        "param_key": "xBoostState",
+    },
+    "enBeep": {
+        "name": "Beep",
+        "icon": "mdi:volume-high",
+        "command": DeltaPro3Cmd.SET_BEEP,
+        "param_key": "beepState",
+    },
+    "acEnergySavingOpen": {
+        "name": "AC Energy Saving",
+        "icon": "mdi:leaf",
+        "command": DeltaPro3Cmd.SET_AC_OUT,  # May need specific command
+        "param_key": "acOutState",
+    },
+}
+
+# Number entities for Delta Pro 3 (adjustable values)
+_DELTA_PRO_3_NUMBERS: dict[str, dict[str, Any]] = {
+    "plugInInfoAcInChgPowMax": {
+        "name": "AC Charging Power",
+        "unit": UNIT_W,
+        "min": 200,
+        "max": 3000,
+        "step": 100,
+        "icon": "mdi:lightning-bolt",
+        "command": DeltaPro3Cmd.SET_AC_CHARGE_SPEED,
+        "param_key": "acChgPower",
+    },
+    "cmsMaxChgSoc": {
+        "name": "Max Charge Level",
+        "unit": UNIT_PCT,
+        "min": 50,
+        "max": 100,
+        "step": 1,
+        "icon": "mdi:battery-charging-100",
+        "command": DeltaPro3Cmd.SET_CHARGE_LEVEL,
+        "param_key": "maxChgSoc",
+    },
+    "cmsMinDsgSoc": {
+        "name": "Min Discharge Level",
+        "unit": UNIT_PCT,
+        "min": 0,
+        "max": 30,
+        "step": 1,
+        "icon": "mdi:battery-low",
+        "command": DeltaPro3Cmd.SET_CHARGE_LEVEL,
+        "param_key": "minDsgSoc",
+    },
+    "acStandbyTime": {
+        "name": "AC Standby Time",
+        "unit": UNIT_MIN,
+        "min": 0,
+        "max": 1440,
+        "step": 1,
+        "icon": "mdi:timer-outline",
+        "command": DeltaPro3Cmd.SET_AC_STANDBY_TIME,
+        "param_key": "acStandbyTime",
+    },
+    "dcStandbyTime": {
+        "name": "DC Standby Time",
+        "unit": UNIT_MIN,
+        "min": 0,
+        "max": 1440,
+        "step": 1,
+        "icon": "mdi:timer-outline",
+        "command": DeltaPro3Cmd.SET_DC_STANDBY_TIME,
+        "param_key": "dcStandbyTime",
+    },
+    "screenOffTime": {
+        "name": "Screen Off Time",
+        "unit": UNIT_S,
+        "min": 0,
+        "max": 3600,
+        "step": 10,
+        "icon": "mdi:monitor-off",
+        "command": DeltaPro3Cmd.SET_LCD_STANDBY_TIME,
+        "param_key": "lcdOffTime",
+    },
+    "lcdLight": {
+        "name": "LCD Brightness",
+        "unit": UNIT_PCT,
+        "min": 0,
+        "max": 100,
+        "step": 1,
+        "icon": "mdi:brightness-6",
+        "command": DeltaPro3Cmd.SET_LCD_BRIGHTNESS,
+        "param_key": "lcdLight",
+    },
+}
 
+# Read-only views of the tables
+DELTA_PRO_3_SENSORS: Final = MappingProxyType(_DELTA_PRO_3_SENSORS)
+DELTA_PRO_3_BINARY_SENSORS: Final = MappingProxyType(_DELTA_PRO_3_BINARY_SENSORS)
+DELTA_PRO_3_SWITCHES: Final = MappingProxyType(_DELTA_PRO_3_SWITCHES)
+DELTA_PRO_3_NUMBERS: Final = MappingProxyType(_DELTA_PRO_3_NUMBERS)
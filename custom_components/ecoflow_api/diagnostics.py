@@ -1,9 +1,11 @@
 """Diagnostics support for EcoFlow API integration."""
 from __future__ import annotations
 
-from typing import Any
+import re
+from collections.abc import Mapping
+from typing import Any, Final
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
@@ -18,14 +20,53 @@ from .coordinator import EcoFlowDataCoordinator
 from .hybrid_coordinator import EcoFlowHybridCoordinator
 
 # Keys to redact from diagnostics
-TO_REDACT = {
-    CONF_ACCESS_KEY,
-    CONF_SECRET_KEY,
-    CONF_DEVICE_SN,
-    "sn",
-    "serial_number",
-    "serialNumber",
-}
+TO_REDACT: Final = frozenset(
+    {
+        CONF_ACCESS_KEY,
+        CONF_SECRET_KEY,
+        CONF_DEVICE_SN,
+        "sn",
+        "serial_number",
+        "serialNumber",
+    }
+)
+
+
+# Matches a redacted key on its own or as the last segment of a dotted
+# quota key (e.g. "bms_bmsStatus.sn")
+_REDACT_RE = re.compile(
+    r"(?:^|\.)(?:%s)$" % "|".join(map(re.escape, sorted(TO_REDACT)))
+)
+
+
+def _redact(obj: Any) -> Any:
+    """Redact sensitive keys from config or device data in one pass.
+    
+    Keys are checked with a frozenset probe first and fall back to the
+    compiled matcher only on a miss. Mappings and lists are always copied,
+    so the result never shares containers with the config entry or the
+    coordinator data; read-only mappings come back as plain dicts.
+    
+    Args:
+        obj: Value to redact
+        
+    Returns:
+        Redacted copy of the value
+    """
+    if isinstance(obj, list):
+        return [_redact(item) for item in obj]
+    if not isinstance(obj, Mapping):
+        return obj
+    
+    redacted: dict[str, Any] = {}
+    for key, value in obj.items():
+        if value is None or value == "":
+            redacted[key] = value
+        elif key in TO_REDACT or (isinstance(key, str) and _REDACT_RE.search(key)):
+            redacted[key] = REDACTED
+        else:
+            redacted[key] = _redact(value)
+    return redacted
 
 
 async def async_get_config_entry_diagnostics(
@@ -47,12 +88,12 @@ async def async_get_config_entry_diagnostics(
     diagnostic_mode = entry.options.get(OPTS_DIAGNOSTIC_MODE, False)
     
     # Redact sensitive data from config entry
-    redacted_config = async_redact_data(entry.data, TO_REDACT)
+    redacted_config = _redact(entry.data)
     
     # Get device data (redacted)
     device_data = {}
     if coordinator.data:
-        device_data = async_redact_data(coordinator.data, TO_REDACT)
+        device_data = _redact(coordinator.data)
     
     # Build coordinator info
     coordinator_info = {
@@ -71,19 +112,11 @@ async def async_get_config_entry_diagnostics(
     if diagnostic_mode:
         diagnostic_data = {}
         
-        # REST requests
-        if hasattr(coordinator, "rest_requests"):
-            diagnostic_data["rest_requests"] = list(coordinator.rest_requests)
-        
-        # MQTT messages (if hybrid)
-        if isinstance(coordinator, EcoFlowHybridCoordinator) and hasattr(coordinator, "mqtt_messages"):
-            diagnostic_data["mqtt_messages"] = list(coordinator.mqtt_messages)
-        
-        # Set commands and replies
-        if hasattr(coordinator, "set_commands"):
-            diagnostic_data["set_commands"] = list(coordinator.set_commands)
-        if hasattr(coordinator, "set_replies"):
-            diagnostic_data["set_replies"] = list(coordinator.set_replies)
+        # REST requests, MQTT messages (hybrid only), set commands and replies
+        for name in ("rest_requests", "mqtt_messages", "set_commands", "set_replies"):
+            buffer = getattr(coordinator, name, None)
+            if buffer is not None:
+                diagnostic_data[name] = list(buffer)
     
     return {
         "config_entry": {
@@ -92,11 +125,12 @@ async def async_get_config_entry_diagnostics(
             "domain": entry.domain,
             "title": entry.title,
             "data": redacted_config,
+            # entry.options is a read-only proxy, which is not JSON serializable
             "options": dict(entry.options),
         },
         "coordinator": coordinator_info,
         "device_info": {
-            "identifiers": list(coordinator.device_info.get("identifiers", [])),
+            "identifiers": coordinator.device_identifiers,
             "name": coordinator.device_info.get("name"),
             "manufacturer": coordinator.device_info.get("manufacturer"),
             "model": coordinator.device_info.get("model"),
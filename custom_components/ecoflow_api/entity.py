@@ -6,9 +6,13 @@ from typing import Any
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, DEVICE_TYPES
+from .const import DOMAIN
 from .coordinator import EcoFlowDataCoordinator
 
+# Possible data keys for firmware and hardware versions, in priority order
+_SW_KEYS = ("sysVer", "sysVersion", "firmwareVersion")
+_HW_KEYS = ("hwVer", "hwVersion", "hardwareVersion")
+
 
 class EcoFlowBaseEntity(CoordinatorEntity[EcoFlowDataCoordinator]):
     """Base class for EcoFlow entities.
@@ -34,50 +38,54 @@ class EcoFlowBaseEntity(CoordinatorEntity[EcoFlowDataCoordinator]):
         """
         super().__init__(coordinator)
         self._entity_key = entity_key
-        self._attr_unique_id = f"{coordinator.device_sn}_{entity_key}"
+        self._attr_unique_id = coordinator.unique_id_prefix + entity_key
+        self._device_type_label = coordinator.model
+        # device_info is rebuilt only when the reported versions change
+        self._cached_device_info: DeviceInfo | None = None
+        self._cached_versions: tuple[Any, Any] | None = None
 
     @property
     def device_info(self) -> DeviceInfo:
-        """Return device info."""
+        """Return device info.
+        
+        The DeviceInfo is cached and only rebuilt when the firmware or
+        hardware version reported by the device changes.
+        """
         # Get firmware and hardware versions from data if available
         sw_version = None
         hw_version = None
         
-        if self.coordinator.data:
-            # Try different possible keys for firmware version
-            sw_version = (
-                self.coordinator.data.get("sysVer") or
-                self.coordinator.data.get("sysVersion") or
-                self.coordinator.data.get("firmwareVersion")
-            )
-            # Try different possible keys for hardware version
-            hw_version = (
-                self.coordinator.data.get("hwVer") or
-                self.coordinator.data.get("hwVersion") or
-                self.coordinator.data.get("hardwareVersion")
-            )
-            
-            # Convert sysVer to string if it's a number
-            if sw_version and isinstance(sw_version, (int, float)):
-                sw_version = str(sw_version)
+        data = self.coordinator.data
+        if data:
+            data_get = data.get
+            sw_version = next((v for k in _SW_KEYS if (v := data_get(k))), None)
+            hw_version = next((v for k in _HW_KEYS if (v := data_get(k))), None)
+        
+        versions = (sw_version, hw_version)
+        if self._cached_device_info is not None and versions == self._cached_versions:
+            return self._cached_device_info
+        
+        # Convert sysVer to string if it's a number
+        if sw_version and isinstance(sw_version, (int, float)):
+            sw_version = str(sw_version)
         
-        return DeviceInfo(
+        self._cached_versions = versions
+        self._cached_device_info = DeviceInfo(
             identifiers={(DOMAIN, self.coordinator.device_sn)},
-            name=f"EcoFlow {DEVICE_TYPES.get(self.coordinator.device_type, self.coordinator.device_type)}",
+            name=f"EcoFlow {self._device_type_label}",
             manufacturer="EcoFlow",
-            model=DEVICE_TYPES.get(
-                self.coordinator.device_type,
-                self.coordinator.device_type
-            ),
+            model=self._device_type_label,
             serial_number=self.coordinator.device_sn,
             sw_version=sw_version,
             hw_version=hw_version,
         )
+        return self._cached_device_info
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.data is not None
+        coordinator = self.coordinator
+        return coordinator.last_update_success and coordinator.data is not None
 
     def with_category(self, category: EntityCategory) -> "EcoFlowBaseEntity":
         """Set entity category (builder pattern).
@@ -8,21 +8,63 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, timedelta
-from typing import Any
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from .api import EcoFlowApiClient, EcoFlowApiError
+from .api import EcoFlowApiClient, EcoFlowApiError, EcoFlowConnectionError
 from .coordinator import EcoFlowDataCoordinator
 from .data_holder import BoundFifoList
-from .mqtt_client import EcoFlowMQTTClient
+
+if TYPE_CHECKING:
+    from .mqtt_client import EcoFlowMQTTClient
 
 _LOGGER = logging.getLogger(__name__)
 
+# After an MQTT dispatch, messages arriving within this window (seconds) are
+# dispatched to listeners together at its end
+MQTT_DISPATCH_DELAY: Final = 0.1
+
+# While MQTT is connected, the coordinator's own REST schedule runs at this
+# multiple of the update interval as a fallback
+MQTT_FALLBACK_FACTOR: Final = 4
+
+# While MQTT is fresh, at most this many REST polls in a row are skipped
+# before one goes through as a heartbeat
+MQTT_REST_SKIP_CYCLES: Final = 5
+
+# Smoothing factor for the moving average of MQTT inter-arrival gaps, and
+# how many average gaps of silence still count as a healthy stream
+MQTT_GAP_ALPHA: Final = 0.2
+MQTT_SILENCE_GAPS: Final = 3
+
+# Time budgets (seconds) for the quota poll and the wake-up request, well
+# below the client's own API_TIMEOUT so a hung device can't hold a poll slot
+REST_QUOTA_TIMEOUT: Final = 10
+WAKE_REQUEST_TIMEOUT: Final = 3
+
+# First delay (seconds) before retrying a failed MQTT connection, doubled
+# per failed attempt up to MQTT_RETRY_MAX
+MQTT_RETRY_DELAY: Final = 30
+MQTT_RETRY_MAX: Final = 600
+
+# Upper bound (seconds) for the REST poll delay while backing off after
+# consecutive failures
+REST_BACKOFF_MAX: Final = 600
+
+
+# Sentinel for fields not yet present in the merged data
+_MISSING: Final = object()
+
 
 class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
     """Hybrid coordinator using both REST API and MQTT.
@@ -69,6 +111,9 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
             update_interval=update_interval,
             config_entry=config_entry,
         )
+        # Only notify listeners when a refresh actually changes the data;
+        # MQTT pushes already keep entities current between polls
+        self.always_update = False
         
         self.mqtt_enabled = mqtt_enabled
         self.mqtt_username = mqtt_username
@@ -77,14 +122,53 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         
         self._mqtt_client: EcoFlowMQTTClient | None = None
         self._mqtt_data: dict[str, Any] = {}
+        # Live REST + MQTT view handed to listeners; every REST result
+        # rebuilds it and MQTT deltas are then applied in place
+        self._merged: dict[str, Any] = {}
+        # Coalesces listener dispatches for bursts of MQTT messages
+        self._mqtt_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=MQTT_DISPATCH_DELAY,
+            immediate=True,
+            function=self._async_push_merged,
+        )
         self._mqtt_connected = False
         self._use_mqtt = False
+        # Cached connection_mode, updated by _set_mqtt_state
+        self._connection_mode = "rest_only"
         
         # Track last REST update time for interval verification
         self._last_rest_update: float | None = None
         
-        # Timer for periodic REST updates (independent of MQTT)
+        # Loop time of the last MQTT message, moving average of the gaps
+        # between messages, and REST polls skipped since the last request
+        self._mqtt_last_msg_ts = 0.0
+        self._mqtt_gap_ewma: float | None = None
+        self._rest_skip_counter = 0
+        # Set by async_request_refresh so the next poll reaches the REST API
+        self._force_rest = False
+        
+        # Pending MQTT connection retry and failed attempts so far
+        self._mqtt_retry_unsub: Callable[[], None] | None = None
+        self._mqtt_retry_count = 0
+        
+        # Event loop thread, recorded in async_setup
+        self._loop_thread_id: int | None = None
+        
+        # Quota request shared by overlapping refreshes
+        self._inflight_quota: asyncio.Task[dict[str, Any]] | None = None
+        
+        # Set by the first MQTT message after a wake-up request
+        self._mqtt_wake_event = asyncio.Event()
+        
+        # Consecutive REST failures; the poll delay doubles with each one
+        self._fail_count = 0
+        
+        # Timer for periodic REST updates (independent of MQTT); the bound
+        # callback is created once instead of per reschedule
         self._rest_update_timer: asyncio.TimerHandle | None = None
+        self._do_rest_update_cb = self._on_rest_timer
         
         # MQTT messages collection for diagnostic mode
         if self._diagnostic_mode:
@@ -102,12 +186,17 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
     @property
     def connection_mode(self) -> str:
         """Return current connection mode."""
-        if self._use_mqtt and self._mqtt_connected:
-            return "hybrid"
-        elif self._mqtt_connected:
-            return "mqtt_standby"
-        else:
-            return "rest_only"
+        return self._connection_mode
+
+    def _set_mqtt_state(self, connected: bool) -> None:
+        """Update the MQTT flags and the cached connection mode.
+        
+        Args:
+            connected: Whether MQTT is connected and used for updates
+        """
+        self._mqtt_connected = connected
+        self._use_mqtt = connected
+        self._connection_mode = "hybrid" if connected else "rest_only"
 
     async def async_setup(self) -> bool:
         """Set up the coordinator (including MQTT if enabled).
@@ -115,6 +204,8 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         Returns:
             True if setup successful
         """
+        self._loop_thread_id = threading.get_ident()
+        
         # Always try to connect MQTT if enabled
         if self.mqtt_enabled and self.mqtt_username and self.mqtt_password:
             await self._async_setup_mqtt()
@@ -144,6 +235,15 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
 
     async def _async_setup_mqtt(self) -> None:
         """Set up MQTT client."""
+        # Imported here so REST-only setups never load paho-mqtt
+        from .mqtt_client import EcoFlowMQTTClient
+        
+        # A client left over from a failed attempt may still be retrying
+        # in its network thread
+        if self._mqtt_client:
+            await self._mqtt_client.async_disconnect()
+            self._mqtt_client = None
+        
         try:
             self._mqtt_client = EcoFlowMQTTClient(
                 username=self.mqtt_username,
@@ -157,26 +257,54 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
             connected = await self._mqtt_client.async_connect()
             
             if connected:
-                self._mqtt_connected = True
-                self._use_mqtt = True
+                self._set_mqtt_state(True)
                 self._logged_mqtt_connected = True
+                self._mqtt_retry_count = 0
+                # MQTT deltas are applied to the live merged dict; rebuild it
+                # now so it carries the MQTT overlay from this connection on
+                self._merged = self._merge_data()
+                # REST polling is driven by _schedule_rest_update; slow the
+                # coordinator's own schedule down to a fallback so the two
+                # don't both poll every interval while MQTT delivers updates,
+                # keeping any backoff from failed polls before a reconnect
+                self._apply_rest_interval()
                 _LOGGER.info(
-                    "✅ MQTT connected to broker for device %s (hybrid mode: MQTT + REST every %ds)",
+                    "✅ MQTT connected to broker for device %s (hybrid mode: MQTT + REST every %ds, fallback every %ds)",
                     self.device_sn[-4:],
-                    self.update_interval_seconds
+                    self.update_interval_seconds,
+                    self.update_interval.total_seconds()
                 )
             else:
                 _LOGGER.warning(
                     "⚠️ MQTT connection failed for device %s, using REST API only",
                     self.device_sn[-4:]
                 )
-                self._mqtt_connected = False
-                self._use_mqtt = False
+                self._set_mqtt_state(False)
+                self._schedule_mqtt_retry()
                 
         except Exception as err:
             _LOGGER.error("🔴 MQTT connection error for device %s: %s", self.device_sn[-4:], err)
-            self._mqtt_connected = False
-            self._use_mqtt = False
+            self._set_mqtt_state(False)
+            self._schedule_mqtt_retry()
+
+    def _schedule_mqtt_retry(self) -> None:
+        """Schedule another MQTT connection attempt with exponential backoff."""
+        delay = min(MQTT_RETRY_DELAY * 2 ** self._mqtt_retry_count, MQTT_RETRY_MAX)
+        # 2**5 times the first delay is already past MQTT_RETRY_MAX
+        self._mqtt_retry_count = min(self._mqtt_retry_count + 1, 5)
+        _LOGGER.info(
+            "Retrying MQTT connection for device %s in %ds",
+            self.device_sn[-4:],
+            delay
+        )
+        self._mqtt_retry_unsub = async_call_later(
+            self.hass, delay, self._async_retry_mqtt
+        )
+
+    async def _async_retry_mqtt(self, _now: datetime) -> None:
+        """Retry the MQTT connection (scheduled by _schedule_mqtt_retry)."""
+        self._mqtt_retry_unsub = None
+        await self._async_setup_mqtt()
 
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
@@ -184,11 +312,20 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         if self._rest_update_timer:
             self._rest_update_timer.cancel()
             self._rest_update_timer = None
+        
+        # Drop a pending MQTT connection retry
+        if self._mqtt_retry_unsub:
+            self._mqtt_retry_unsub()
+            self._mqtt_retry_unsub = None
+        
+        # Drop a pending MQTT dispatch
+        self._mqtt_debouncer.async_cancel()
             
         # Disconnect MQTT
         if self._mqtt_client:
             await self._mqtt_client.async_disconnect()
             self._mqtt_client = None
+            self._set_mqtt_state(False)
     
     def _schedule_rest_update(self) -> None:
         """Schedule next REST update.
@@ -199,18 +336,61 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         if self._rest_update_timer:
             self._rest_update_timer.cancel()
         
-        # Schedule next update - use hass.async_create_task for proper tracking
-        async def do_update():
-            try:
-                await self._do_rest_update()
-            except Exception as err:
-                _LOGGER.error("Error in scheduled REST update: %s", err)
-        
-        self._rest_update_timer = self.hass.loop.call_later(
-            self.update_interval_seconds,
-            lambda: self.hass.async_create_task(do_update())
+        # Schedule next update
+        loop = self.hass.loop
+        self._rest_update_timer = loop.call_at(
+            loop.time() + self._rest_delay(1), self._do_rest_update_cb
         )
     
+    def _on_rest_timer(self) -> None:
+        """Start the scheduled REST update (REST timer callback)."""
+        # Use hass.async_create_task for proper tracking
+        self.hass.async_create_task(self._do_rest_update())
+    
+    def _rest_delay(self, factor: int) -> int:
+        """Return a REST poll delay, backed off after consecutive failures.
+        
+        Args:
+            factor: Multiple of the configured update interval used when
+                there are no failures
+            
+        Returns:
+            Delay in seconds, capped at REST_BACKOFF_MAX
+        """
+        return min(
+            self.update_interval_seconds * factor * 2 ** self._fail_count,
+            REST_BACKOFF_MAX,
+        )
+
+    def _update_backoff(self, failed: bool) -> None:
+        """Track REST failures and back the coordinator's schedule off.
+        
+        Args:
+            failed: Whether the last REST request failed
+        """
+        if not failed and not self._fail_count:
+            return
+        # 2**10 times any interval is already past REST_BACKOFF_MAX
+        self._fail_count = min(self._fail_count + 1, 10) if failed else 0
+        self._apply_rest_interval()
+
+    def _apply_rest_interval(self) -> None:
+        """Set the coordinator's schedule from the interval, MQTT and backoff."""
+        factor = MQTT_FALLBACK_FACTOR if self._use_mqtt and self._mqtt_connected else 1
+        self.update_interval = timedelta(seconds=self._rest_delay(factor))
+
+    async def async_set_update_interval(self, interval_seconds: int) -> None:
+        """Set the update interval, keeping the MQTT fallback slowdown.
+        
+        The base class resets the schedule to the plain interval; while MQTT
+        is connected REST stays a slow fallback, and failure backoff is kept.
+        
+        Args:
+            interval_seconds: New update interval in seconds
+        """
+        await super().async_set_update_interval(interval_seconds)
+        self._apply_rest_interval()
+
     async def _do_rest_update(self) -> None:
         """Perform REST update and schedule next one."""
         _LOGGER.debug("Executing scheduled REST update")
@@ -223,6 +403,14 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
             # Schedule next update
             self._schedule_rest_update()
 
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that is not served from MQTT data.
+        
+        Used after setter commands, so the new state is read back from the
+        REST API even while MQTT is fresh.
+        """
+        self._force_rest = True
+        await super().async_request_refresh()
 
     def _handle_mqtt_message(self, payload: dict[str, Any]) -> None:
         """Handle MQTT message from device.
@@ -230,6 +418,18 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         Args:
             payload: MQTT message payload (already extracted from quota topic params)
         """
+        # Keepalives and empty params carry nothing to merge
+        if not payload:
+            return
+        
+        # Any message shows the MQTT stream is alive (monotonic, thread-safe)
+        now = self.hass.loop.time()
+        if self._mqtt_last_msg_ts:
+            gap = now - self._mqtt_last_msg_ts
+            ewma = self._mqtt_gap_ewma
+            self._mqtt_gap_ewma = gap if ewma is None else ewma + MQTT_GAP_ALPHA * (gap - ewma)
+        self._mqtt_last_msg_ts = now
+        
         try:
             # Check if event loop is still running (Home Assistant not shutting down)
             if not self.hass.loop.is_running() or self.hass.loop.is_closed():
@@ -252,13 +452,12 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
                 )
                 
                 if fields_count > 0:
-                    field_names = list(mqtt_data.keys())
                     if fields_count <= 10:
-                        _LOGGER.debug("   Fields: %s", ", ".join(field_names))
+                        _LOGGER.debug("   Fields: %s", ", ".join(mqtt_data))
                     else:
                         _LOGGER.debug(
                             "   Fields: %s ... (+%d more)",
-                            ", ".join(field_names[:10]),
+                            ", ".join(islice(mqtt_data, 10)),
                             fields_count - 10
                         )
             
@@ -270,42 +469,81 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
                     "payload": mqtt_data,
                 })
             
-            # Merge MQTT data with existing data
-            self._mqtt_data.update(mqtt_data)
-            
-            # Schedule update in Home Assistant event loop
-            # MQTT callback runs in different thread, so we need to schedule it properly
-            merged_data = self._merge_data()
-            
-            # Schedule update in HA event loop from MQTT thread
-            # async_set_updated_data is a sync method (despite the async_ prefix)
-            # Use call_soon_threadsafe to schedule it in the correct event loop
-            self.hass.loop.call_soon_threadsafe(lambda: self.async_set_updated_data(merged_data))
+            # Schedule the merge in Home Assistant event loop
+            # MQTT callback normally runs in paho's thread, and the merged
+            # dict is the one listeners read, so it is only mutated from the
+            # loop; the cheaper call_soon is enough when already on it
+            if threading.get_ident() == self._loop_thread_id:
+                self.hass.loop.call_soon(self._apply_mqtt_data, mqtt_data)
+            else:
+                self.hass.loop.call_soon_threadsafe(self._apply_mqtt_data, mqtt_data)
             
         except RuntimeError:
             # Event loop closed during shutdown - ignore silently
             pass
-        except Exception as err:
+        except (TypeError, KeyError, AttributeError, ValueError) as err:
+            # Malformed payload (e.g. params that aren't an object)
             _LOGGER.error("Error handling MQTT message: %s", err)
 
+    @callback
+    def _apply_mqtt_data(self, mqtt_data: dict[str, Any]) -> None:
+        """Merge an MQTT delta into the live data and schedule a dispatch.
+        
+        Runs in the event loop. Only the received fields are written, so a
+        message costs O(len(mqtt_data)) instead of a full REST + MQTT copy.
+        Listeners are not notified when the message changes nothing, and a
+        burst of messages is dispatched through the MQTT debouncer: the first
+        one right away, the rest once at the end of MQTT_DISPATCH_DELAY.
+        
+        Args:
+            mqtt_data: Fields received in one MQTT message
+        """
+        self._mqtt_wake_event.set()
+        self._mqtt_data |= mqtt_data
+        merged = self._merged
+        # Before MQTT is connected and a REST result has seeded the live
+        # view, the delta is only kept for the next rebuild
+        if not (self._mqtt_connected and merged):
+            return
+        changed = {
+            key: value
+            for key, value in mqtt_data.items()
+            if merged.get(key, _MISSING) != value
+        }
+        if not changed:
+            return
+        merged |= changed
+        self._mqtt_debouncer.async_schedule_call()
+
+    @callback
+    def _async_push_merged(self) -> None:
+        """Notify listeners of the MQTT data merged since the last dispatch.
+        
+        A callback rather than a coroutine, so the debouncer runs it inline
+        instead of wrapping every dispatch in a task.
+        """
+        self.async_set_updated_data(self._merged)
 
     def _merge_data(self) -> dict[str, Any]:
         """Merge REST API and MQTT data.
         
-        Priority: MQTT data > REST data (MQTT is more real-time)
+        Priority: MQTT data > REST data (MQTT is more real-time). MQTT data
+        is only overlaid while MQTT is connected.
+        
+        Only used to rebuild the live merged dict, once per REST result and
+        on MQTT connect; MQTT messages update that dict in place. A REST
+        update needs a new dict rather than an in-place update, both so MQTT
+        values keep priority and so the coordinator (always_update=False)
+        sees the data change.
         
         Returns:
-            Merged data dictionary
+            New merged data dictionary
         """
-        # Start with REST data
-        merged = dict(self._last_data)
-        
-        # Overlay MQTT data (more recent)
-        merged.update(self._mqtt_data)
-        
-        return merged
+        if self._use_mqtt and self._mqtt_connected:
+            return self._last_data | self._mqtt_data
+        return dict(self._last_data)
 
-    async def _async_wake_device(self) -> None:
+    async def _async_wake_device(self) -> dict[str, Any] | None:
         """Wake up device before requesting data.
         
         Some EcoFlow devices go to sleep and don't respond to API requests
@@ -322,29 +560,103 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
         - Return stale data via REST API
         - Not update timestamps
         
-        Solution: Always wake device before REST polling to ensure fresh data.
+        Solution: Wake device before REST polling to ensure fresh data,
+        unless it has recently delivered MQTT data and is therefore awake.
+        
+        Returns:
+            The wake-up response if it already differs from the last REST
+            data (the device was awake), otherwise None
         """
-        # Always wake device before REST polling
-        # This ensures we get fresh data even if device was sleeping
+        # A device that has recently pushed MQTT updates is awake, skip the
+        # extra request and delay; a connected but silent stream still wakes
+        if self._mqtt_is_fresh():
+            return None
+        
         try:
             # Send wake-up request - this wakes the device
-            await self.client.get_device_quota(self.device_sn)
+            self._mqtt_wake_event.clear()
+            async with asyncio.timeout(WAKE_REQUEST_TIMEOUT):
+                quota = await self._async_fetch_quota()
+            
+            # Changed values mean the device is awake and reporting live
+            # data, so the wake-up response can serve as this poll's data
+            if quota and quota != self._last_data:
+                return quota
             
-            # Short delay to allow device to wake up and prepare data
-            await asyncio.sleep(1.0)
+            # Give the device a short moment to wake up and prepare data;
+            # an MQTT message in the meantime shows it is already awake
+            try:
+                await asyncio.wait_for(self._mqtt_wake_event.wait(), 0.2)
+            except asyncio.TimeoutError:
+                pass
                 
         except Exception:
             # Don't fail on wake-up errors - device might already be awake
             pass
+        return None
+
+    async def _async_fetch_quota(self) -> dict[str, Any]:
+        """Fetch the device quota, joining a request already in flight.
+        
+        A setter refresh racing the scheduled poll awaits the same request
+        instead of sending a second one to the rate-limited API. The shared
+        task is shielded so a caller's timeout doesn't cancel it for others.
+        
+        Returns:
+            Device quota data
+        """
+        task = self._inflight_quota
+        if task is None or task.done():
+            task = self._inflight_quota = self.hass.loop.create_task(
+                self.client.get_device_quota(self.device_sn)
+            )
+        return await asyncio.shield(task)
+
+    def _mqtt_is_fresh(self) -> bool:
+        """Return whether MQTT has delivered data recently enough to trust.
+        
+        The allowed silence adapts to the device's observed MQTT cadence:
+        MQTT_SILENCE_GAPS average gaps, but at least one update interval and
+        at most MQTT_FALLBACK_FACTOR of them.
+        """
+        if not (self._use_mqtt and self._mqtt_connected and self._merged):
+            return False
+        interval = self.update_interval_seconds
+        window = interval * MQTT_FALLBACK_FACTOR
+        if self._mqtt_gap_ewma is not None:
+            window = min(window, max(interval, MQTT_SILENCE_GAPS * self._mqtt_gap_ewma))
+        return self.hass.loop.time() - self._mqtt_last_msg_ts < window
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API (and merge with MQTT if available).
         
+        While MQTT is fresh (see _mqtt_is_fresh), most polls return the
+        live merged data without a REST request; every
+        MQTT_REST_SKIP_CYCLES-th poll and any requested refresh still go
+        through.
+        
         Returns:
             Device data dictionary
             
         Raises:
             UpdateFailed: If data fetch fails
         """
+        if (
+            not self._force_rest
+            and self._rest_skip_counter < MQTT_REST_SKIP_CYCLES
+            and self._mqtt_is_fresh()
+        ):
+            self._rest_skip_counter += 1
+            _LOGGER.debug(
+                "MQTT data is fresh for %s, skipping REST update (%d/%d)",
+                self.device_sn[-4:],
+                self._rest_skip_counter,
+                MQTT_REST_SKIP_CYCLES
+            )
+            return self._merged
+        self._force_rest = False
+        self._rest_skip_counter = 0
+        
         try:
             # Debug logging (only if logger level is DEBUG)
             if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -363,10 +675,17 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
                 )
             
             # Wake up device before requesting data
-            await self._async_wake_device()
+            quota = await self._async_wake_device()
             
-            # Fetch from REST API
-            rest_data = await self.client.get_device_quota(self.device_sn)
+            # Fetch from REST API unless the wake-up already returned fresh data
+            if quota is None:
+                try:
+                    async with asyncio.timeout(REST_QUOTA_TIMEOUT):
+                        quota = await self._async_fetch_quota()
+                except asyncio.TimeoutError as err:
+                    raise EcoFlowConnectionError("REST quota request timed out") from err
+            rest_data = self._intern_data_keys(quota)
+            self._update_backoff(failed=False)
             
             # Log success only once (first successful request)
             if not self._logged_rest_success:
@@ -415,14 +734,12 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
             # Update last REST update timestamp
             self._last_rest_update = time.time()
             
-            # Store last successful REST data
+            # Store last successful REST data and rebuild the live view
             self._last_data = rest_data
+            self._merged = self._merge_data()
             
-            # If MQTT is active, merge data
+            # Debug: Log merge info when MQTT is active
             if self._use_mqtt and self._mqtt_connected:
-                merged = self._merge_data()
-                
-                # Debug: Log merge info
                 if _LOGGER.isEnabledFor(logging.DEBUG):
                     timestamp = datetime.now().strftime("%H:%M:%S")
                     _LOGGER.debug(
@@ -431,21 +748,20 @@ class EcoFlowHybridCoordinator(EcoFlowDataCoordinator):
                         self.device_sn[-4:],
                         len(rest_data),
                         len(self._mqtt_data),
-                        len(merged)
+                        len(self._merged)
                     )
-                
-                return merged
-            else:
-                # REST only
-                return rest_data
+            
+            return self._merged
             
         except EcoFlowApiError as err:
             _LOGGER.error("Error fetching REST data for %s: %s", self.device_sn, err)
+            self._update_backoff(failed=True)
             
             # If MQTT is available, use MQTT data only
             if self._use_mqtt and self._mqtt_connected and self._mqtt_data:
                 _LOGGER.info("Using MQTT data only (REST API failed)")
-                return self._merge_data()
+                self._merged = self._merge_data()
+                return self._merged
             
             raise UpdateFailed(f"Error fetching data: {err}") from err
 
@@ -21,6 +21,7 @@ import asyncio
 import json
 import logging
 import ssl
+import sys
 from typing import Any, Callable
 
 import paho.mqtt.client as mqtt
@@ -34,6 +35,16 @@ MQTT_KEEPALIVE = 60
 MQTT_PROTOCOL = mqtt.MQTTv311
 
 
+def _interned_object(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """Build a decoded JSON object with interned keys.
+
+    The compiler interns identifier-like literals such as the definition
+    table keys, so interned payload keys let coordinator data lookups match
+    on identity instead of comparing string contents.
+    """
+    return {sys.intern(key): value for key, value in pairs}
+
+
 class EcoFlowMQTTClient:
     """EcoFlow MQTT client for real-time device updates."""
 
@@ -249,7 +260,9 @@ class EcoFlowMQTTClient:
     ) -> None:
         """Handle received MQTT message."""
         try:
-            payload = json.loads(msg.payload.decode())
+            payload = json.loads(
+                msg.payload.decode(), object_pairs_hook=_interned_object
+            )
             
             # Handle different topic types
             if msg.topic == self._quota_topic:
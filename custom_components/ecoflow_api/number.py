@@ -688,7 +688,7 @@ class EcoFlowNumber(EcoFlowBaseEntity, NumberEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )
@@ -771,7 +771,7 @@ class EcoFlowDeltaProNumber(EcoFlowBaseEntity, NumberEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )
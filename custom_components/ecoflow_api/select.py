@@ -394,7 +394,7 @@ class EcoFlowSelect(EcoFlowBaseEntity, SelectEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )
@@ -474,7 +474,7 @@ class EcoFlowDeltaProSelect(EcoFlowBaseEntity, SelectEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.integration.sensor import IntegrationSensor
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
@@ -38,6 +40,27 @@ from .hybrid_coordinator import EcoFlowHybridCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Enum sensor states indexed by the raw integer reported by the API
+FLOW_STATE_BY_INT = ("disconnected", "connected", "active")
+CHG_DSG_STATE_BY_INT = ("idle", "charging", "discharging")
+
+
+def _state_from_int(states: tuple[str, ...], value: Any) -> str:
+    """Decode an integer state code into its enum option.
+
+    Args:
+        states: Options indexed by raw state code
+        value: Raw value from the API
+
+    Returns:
+        Matching option, or the first option for unknown codes
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, int) and 0 <= value < len(states):
+        return states[value]
+    return states[0]
+
 
 # Sensor definitions for Delta Pro 3 based on real API keys
 DELTA_PRO_3_SENSOR_DEFINITIONS = {
@@ -2148,6 +2171,56 @@ DEVICE_SENSOR_MAP = {
 }
 
 
+def _build_sensor_descriptions(
+    definitions: dict[str, dict[str, Any]],
+) -> MappingProxyType[str, SensorEntityDescription]:
+    """Build entity descriptions for a sensor definition table.
+
+    Descriptions are built once at import, so entity setup reuses them
+    instead of re-reading every definition dict per entity.
+
+    Args:
+        definitions: Sensor definitions keyed by sensor ID
+
+    Returns:
+        Read-only mapping of sensor ID to entity description
+    """
+    return MappingProxyType(
+        {
+            sensor_id: SensorEntityDescription(
+                key=sensor_id,
+                native_unit_of_measurement=config.get("unit"),
+                device_class=config.get("device_class"),
+                state_class=config.get("state_class"),
+                icon=config.get("icon"),
+                options=(
+                    config.get("options", [])
+                    if config.get("device_class") == SensorDeviceClass.ENUM
+                    else None
+                ),
+            )
+            for sensor_id, config in definitions.items()
+        }
+    )
+
+
+# Prebuilt sensor descriptions, one per definition table; device type
+# aliases share a table, so they share its descriptions too
+_SENSOR_DESCRIPTIONS_BY_TABLE = {
+    id(definitions): _build_sensor_descriptions(definitions)
+    for definitions in {
+        id(definitions): definitions for definitions in DEVICE_SENSOR_MAP.values()
+    }.values()
+}
+
+# Map device types to their prebuilt sensor descriptions, derived from
+# DEVICE_SENSOR_MAP so both tables always cover the same device types and keys
+DEVICE_SENSOR_DESCRIPTION_MAP = {
+    device_type: _SENSOR_DESCRIPTIONS_BY_TABLE[id(definitions)]
+    for device_type, definitions in DEVICE_SENSOR_MAP.items()
+}
+
+
 # ============================================================================
 # Energy Integration Sensors
 # ============================================================================
@@ -2210,7 +2283,7 @@ class EcoFlowPowerDifferenceSensor(SensorEntity, EcoFlowBaseEntity):
         output_sensor: SensorEntity,
     ):
         """Initialize power difference sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, "power_difference")
         self._attr_unique_id = f"{entry.entry_id}_power_difference"
         self._attr_name = "Power Difference"
         self._attr_icon = "mdi:transmission-tower-export"
@@ -2328,16 +2401,18 @@ async def async_setup_entry(
     sensor_definitions = DEVICE_SENSOR_MAP.get(
         device_type, DELTA_PRO_3_SENSOR_DEFINITIONS
     )
+    sensor_descriptions = _SENSOR_DESCRIPTIONS_BY_TABLE[id(sensor_definitions)]
 
     # Create sensor entities
     entities = []
-    for sensor_id, sensor_config in sensor_definitions.items():
+    for sensor_id, description in sensor_descriptions.items():
         entities.append(
             EcoFlowSensor(
                 coordinator=coordinator,
                 entry=entry,
                 sensor_id=sensor_id,
-                sensor_config=sensor_config,
+                sensor_config=sensor_definitions[sensor_id],
+                description=description,
             )
         )
 
@@ -2424,9 +2499,10 @@ class EcoFlowSensor(EcoFlowBaseEntity, SensorEntity):
         entry: ConfigEntry,
         sensor_id: str,
         sensor_config: dict[str, Any],
+        description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry)
+        super().__init__(coordinator, sensor_id)
         self._sensor_id = sensor_id
         self._sensor_config = sensor_config
         self._attr_unique_id = f"{entry.entry_id}_{sensor_id}"
@@ -2434,15 +2510,9 @@ class EcoFlowSensor(EcoFlowBaseEntity, SensorEntity):
         self._attr_name = sensor_config.get("name", sensor_id)
         self._attr_has_entity_name = True
 
-        # Set sensor attributes from config
-        self._attr_native_unit_of_measurement = sensor_config.get("unit")
-        self._attr_device_class = sensor_config.get("device_class")
-        self._attr_state_class = sensor_config.get("state_class")
-        self._attr_icon = sensor_config.get("icon")
-
-        # For ENUM sensors, set options
-        if sensor_config.get("device_class") == SensorDeviceClass.ENUM:
-            self._attr_options = sensor_config.get("options", [])
+        # Unit, device class, state class, icon and options come from the
+        # prebuilt description
+        self.entity_description = description
 
     @property
     def native_value(self) -> Any:
@@ -2467,7 +2537,7 @@ class EcoFlowSensor(EcoFlowBaseEntity, SensorEntity):
 
         # Handle special cases
         # Timestamp sensors - convert string to datetime
-        if self._attr_device_class == SensorDeviceClass.TIMESTAMP:
+        if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
             # Skip if value is 0 or invalid (device not synced yet)
             if value == 0 or value == "0":
                 return None
@@ -2511,13 +2581,11 @@ class EcoFlowSensor(EcoFlowBaseEntity, SensorEntity):
 
         # Flow info status mapping
         if api_key.startswith("flowInfo"):
-            flow_map = {0: "disconnected", 1: "connected", 2: "active"}
-            return flow_map.get(value, "disconnected")
+            return _state_from_int(FLOW_STATE_BY_INT, value)
 
         # Charge/discharge state mapping
-        if api_key in ["bmsChgDsgState", "cmsChgDsgState"]:
-            state_map = {0: "idle", 1: "charging", 2: "discharging"}
-            return state_map.get(value, "idle")
+        if api_key in ("bmsChgDsgState", "cmsChgDsgState"):
+            return _state_from_int(CHG_DSG_STATE_BY_INT, value)
 
         # Handle resvInfo array decoding for Extra Battery sensors
         if "resvInfo" in api_key and isinstance(value, list):
@@ -403,7 +403,7 @@ class EcoFlowSwitch(EcoFlowBaseEntity, SwitchEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )
@@ -494,7 +494,7 @@ class EcoFlowDeltaProSwitch(EcoFlowBaseEntity, SwitchEntity):
         }
 
         try:
-            await self.coordinator.api_client.set_device_quota(
+            await self.coordinator.client.set_device_quota(
                 device_sn=device_sn,
                 cmd_code=payload,
             )